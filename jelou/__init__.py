@@ -5,8 +5,7 @@ Convierte pronunciación IPA del inglés en representación
 fonética legible para hispanohablantes.
 """
 
-from jelou.jelou_api import translate_word, translate_ipa, batch_translate
-from jelou.phonetic_engine import ipa_to_spanish
+import importlib
 
 __version__ = "0.5.0"
 
@@ -15,4 +14,31 @@ __all__ = [
     "translate_ipa",
     "batch_translate",
     "ipa_to_spanish",
+    "ipa_to_spanish_many",
+    "warmup",
+    "clear_cache",
 ]
+
+# Importación diferida (PEP 562): `import jelou` no carga el motor ni el
+# diccionario hasta que se usa uno de estos nombres — el CLI arranca más rápido.
+_LAZY_IMPORTS = {
+    "translate_word": "jelou.jelou_api",
+    "translate_ipa": "jelou.jelou_api",
+    "batch_translate": "jelou.jelou_api",
+    "ipa_to_spanish": "jelou.phonetic_engine",
+    "ipa_to_spanish_many": "jelou.phonetic_engine",
+    "warmup": "jelou.jelou_api",
+    "clear_cache": "jelou.jelou_api",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,9 +8,14 @@ Proyecto: Jelou
 Licencia: MIT
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Tuple
 
-ARPABET_TO_IPA = {
+# Las claves literales ya están internadas por CPython; el hot path usa el dict
+# directo y se expone una vista de solo lectura como tabla pública.
+_ARPABET_TO_IPA = {
     "AA": "ɑ",
     "AE": "æ",
     "AH": "ʌ",
@@ -51,55 +56,77 @@ ARPABET_TO_IPA = {
     "Z": "z",
     "ZH": "ʒ",
 }
+ARPABET_TO_IPA = MappingProxyType(_ARPABET_TO_IPA)
+
+# Vocales que pueden llevar la sílaba tónica
+_STRESSED_VOWELS = frozenset((
+    "AA", "AE", "AH", "AO", "AW", "AY",
+    "EH", "ER", "EY", "IH", "IY", "OW",
+    "OY", "UH", "UW",
+))
+
+# Marcador de vocal tónica: un solo codepoint de uso privado (U+E000) en lugar
+# de un texto largo — concatenar y limpiar cuesta un carácter, no diez
+STRESS_MARKER = "\ue000"
+
+# Vocal tónica ya unida a su marcador — evita concatenar en cada llamada
+_STRESSED_IPA = {
+    vowel: STRESS_MARKER + _ARPABET_TO_IPA[vowel] for vowel in _STRESSED_VOWELS
+}
 
 
-def arpabet_to_ipa(arpabet_sequence: str) -> str:
+def _convert(arpabet_sequence: str, emit_stress: bool) -> str:
     """
-    Convierte ARPABET a IPA insertando ~~STRESS~~ antes de la vocal tónica.
-
-    El stress secundario (2) se ignora — en español solo hay una sílaba tónica.
-    Si hay múltiples stress primarios (1), se toma el último (resuelve "information").
-
-    >>> arpabet_to_ipa("HH EH1 L OW0")
-    'hɛ~~STRESS~~loʊ'  # stress en EH
+    Núcleo compartido ARPABET → IPA. Con emit_stress=False no rastrea la
+    vocal tónica ni inserta el marcador.
     """
     if not arpabet_sequence:
         return ""
 
-    phonemes = arpabet_sequence.upper().split()
+    # Una sola pasada: emite IPA y recuerda el último stress primario (1) en vocal.
+    # ARPABET lleva como mucho un dígito de stress al final — basta un slice.
+    # get/append se enlazan a locales para evitar la búsqueda de atributo por fonema.
+    get_ipa = _ARPABET_TO_IPA.get
+    ipa_result = []
+    append = ipa_result.append
+    primary_stress_index = None
+    stressed_phoneme = None
+    for token in arpabet_sequence.upper().split():
+        stress = token[-1]
+        phoneme = token[:-1] if stress in "012" else token
+        ipa_symbol = get_ipa(phoneme)
+        if ipa_symbol is None:
+            # Varios dígitos o fonema desconocido: este último pasa en minúscula
+            phoneme = token.rstrip("012")
+            ipa_symbol = get_ipa(phoneme) or phoneme.lower()
+        if emit_stress and stress == "1" and phoneme in _STRESSED_VOWELS:
+            primary_stress_index = len(ipa_result)
+            stressed_phoneme = phoneme
+        append(ipa_symbol)
+    if primary_stress_index is not None:
+        ipa_result[primary_stress_index] = _STRESSED_IPA[stressed_phoneme]
+
+    return "".join(ipa_result)
 
-    STRESSED_VOWELS = {
-        "AA", "AE", "AH", "AO", "AW", "AY",
-        "EH", "ER", "EY", "IH", "IY", "OW",
-        "OY", "UH", "UW"
-    }
 
-    # Tomar el último stress primario (1) como vocal tónica
-    primary_stress_index = None
-    for i, phoneme in enumerate(phonemes):
-        if phoneme and phoneme[-1] == "1":
-            clean = phoneme.rstrip("012")
-            if clean in STRESSED_VOWELS:
-                primary_stress_index = i
+@lru_cache(maxsize=65536)
+def arpabet_to_ipa(arpabet_sequence: str) -> str:
+    """
+    Convierte ARPABET a IPA insertando STRESS_MARKER antes de la vocal tónica.
 
-    ipa_result = []
-    for i, phoneme in enumerate(phonemes):
-        clean_phoneme = phoneme.rstrip("012")
-        if clean_phoneme in ARPABET_TO_IPA:
-            ipa_symbol = ARPABET_TO_IPA[clean_phoneme]
-            if i == primary_stress_index:
-                ipa_result.append("~~STRESS~~" + ipa_symbol)
-            else:
-                ipa_result.append(ipa_symbol)
-        else:
-            ipa_result.append(clean_phoneme.lower())
+    El stress secundario (2) se ignora — en español solo hay una sílaba tónica.
+    Si hay múltiples stress primarios (1), se toma el último (resuelve "information").
 
-    return "".join(ipa_result)
+    >>> arpabet_to_ipa("HH EH1 L OW0")
+    'h\\ue000ɛloʊ'  # stress en EH
+    """
+    return _convert(arpabet_sequence, emit_stress=True)
 
 
+@lru_cache(maxsize=65536)
 def arpabet_to_ipa_clean(arpabet_sequence: str) -> str:
-    """Retorna IPA puro sin marcadores ~~STRESS~~. Para mostrar al usuario."""
-    return arpabet_to_ipa(arpabet_sequence).replace("~~STRESS~~", "")
+    """Retorna IPA puro sin STRESS_MARKER. Para mostrar al usuario."""
+    return _convert(arpabet_sequence, emit_stress=False)
 
 
 def parse_cmu_line(line: str) -> Optional[Tuple[str, str]]:
@@ -122,5 +149,6 @@ def parse_cmu_line(line: str) -> Optional[Tuple[str, str]]:
         return None
 
     word, arpabet = parts
-    word = word.split("(")[0].lower()
-    return (word, arpabet_to_ipa_clean(arpabet))
\ No newline at end of file
+    # Claves internadas: el diccionario resultante comparte un solo objeto por palabra
+    word = sys.intern(word.split("(")[0].lower())
+    return (word, arpabet_to_ipa_clean(arpabet))
@@ -12,44 +12,78 @@ Proyecto: Jelou
 Licencia: MIT
 """
 
-import argparse
 import sys
 
-from jelou.jelou_api import translate_word, translate_ipa
+from jelou import __version__
 
+_DESCRIPTION = (
+    "Convierte palabras en inglés a representación fonética "
+    "para hispanohablantes."
+)
 
-def main() -> None:
-    """Punto de entrada del CLI. Entry point definido en pyproject.toml."""
-    parser = argparse.ArgumentParser(
-        prog="jelou",
-        description="Convierte palabras en inglés a representación fonética para hispanohablantes.",
-        epilog="""
+_EPILOG = """
 Ejemplos:
   jelou hello          # busca en el diccionario
   jelou --ipa θɪŋk     # convierte IPA directo
   jelou --ipa /ʃiː/    # acepta formato /.../
   jelou hello -v       # muestra IPA intermedio
-        """,
+"""
+
+# Misma salida que parser.format_help() — sin argumentos o con -h/--help se
+# imprime directamente sin importar ni construir argparse.
+_STATIC_HELP = f"""usage: jelou [-h] [--ipa] [--verbose] [--version] input
+
+{_DESCRIPTION}
+
+positional arguments:
+  input          Palabra en inglés o expresión en IPA
+
+options:
+  -h, --help     show this help message and exit
+  --ipa          Tratar entrada como IPA directo
+  --verbose, -v  Mostrar IPA intermedio
+  --version, -V  show program's version number and exit
+{_EPILOG}"""
+
+
+def _build_parser():
+    """Construye el parser completo. argparse se importa solo cuando hace falta."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="jelou",
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     parser.add_argument("input", help="Palabra en inglés o expresión en IPA")
     parser.add_argument("--ipa", action="store_true", help="Tratar entrada como IPA directo")
     parser.add_argument("--verbose", "-v", action="store_true", help="Mostrar IPA intermedio")
+    parser.add_argument(
+        "--version", "-V", action="version", version=f"jelou {__version__}"
+    )
+    return parser
 
-    args = parser.parse_args()
-    input_text = args.input.strip()
 
-    if args.ipa:
-        if input_text.startswith("/") and input_text.endswith("/"):
-            input_text = input_text[1:-1]
-        result = translate_ipa(input_text)
-        if args.verbose:
-            print(f"IPA:     {input_text}")
-            print(f"Español: {result}")
-        else:
-            print(result)
-        return
+def _run_ipa(input_text: str, verbose: bool) -> None:
+    """Modo IPA directo. Nunca toca el diccionario."""
+    # Importación diferida: --help, --version y errores de argumentos no cargan el motor
+    from jelou.jelou_api import translate_ipa
+
+    if input_text.startswith("/") and input_text.endswith("/"):
+        input_text = input_text[1:-1]
+    result = translate_ipa(input_text)
+    if verbose:
+        print(f"IPA:     {input_text}")
+        print(f"Español: {result}")
+    else:
+        print(result)
+
+
+def _run_word(input_text: str, verbose: bool) -> None:
+    """Modo palabra: busca en el CMU Dictionary. Sale con código 1 si no existe."""
+    from jelou.jelou_api import translate_word
 
     result = translate_word(input_text)
 
@@ -59,7 +93,7 @@ Ejemplos:
         print("   Ejemplo: jelou --ipa θɪŋk", file=sys.stderr)
         sys.exit(1)
 
-    if args.verbose:
+    if verbose:
         print(f"Palabra: {result['word']}")
         print(f"IPA:     {result['ipa']}")
         print(f"Español: {result['spanish']}")
@@ -67,5 +101,35 @@ Ejemplos:
         print(result["spanish"])
 
 
+def main() -> None:
+    """Punto de entrada del CLI. Entry point definido en pyproject.toml."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(_STATIC_HELP)
+        return
+    if argv in (["--version"], ["-V"]):
+        print(f"jelou {__version__}")
+        return
+    # Caso más común, `jelou hello`: un solo argumento sin flags no necesita argparse
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        _run_word(argv[0].strip(), verbose=False)
+        return
+
+    parser = _build_parser()
+    args = parser.parse_args()
+    input_text = args.input.strip()
+
+    if args.verbose:
+        import logging
+
+        # Mensajes de descarga/carga del diccionario a stderr — stdout queda limpio
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(message)s")
+
+    if args.ipa:
+        _run_ipa(input_text, args.verbose)
+    else:
+        _run_word(input_text, args.verbose)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,16 +7,48 @@ Proyecto: Jelou
 Licencia: MIT
 """
 
-import urllib.request
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from jelou.arpabet_to_ipa import arpabet_to_ipa, arpabet_to_ipa_clean
+from jelou.arpabet_to_ipa import _convert, arpabet_to_ipa, arpabet_to_ipa_clean
+from jelou.trie import PhonemeTrie
 
 CMU_DICT_URL = "https://raw.githubusercontent.com/cmusphinx/cmudict/master/cmudict.dict"
 CACHE_DIR = Path.home() / ".jelou"
 CACHE_FILE = CACHE_DIR / "cmudict.txt"
 
+# Días de la semana: forzar variante EY para que terminen en "dei"
+_PREFER_EY = frozenset({
+    'monday', 'tuesday', 'wednesday', 'thursday',
+    'friday', 'saturday', 'sunday',
+    "monday's", "tuesday's", "wednesday's", "thursday's",
+    "friday's", "saturday's", "sunday's",
+    'mondays', 'tuesdays', 'wednesdays', 'thursdays',
+    'fridays', 'saturdays', 'sundays'
+})
+
+# El CMU no tiene variante con ER+EY para saturday — se define manualmente
+_MANUAL_OVERRIDES = {
+    'saturday': 'S AE1 T ER0 D EY2',
+    "saturday's": 'S AE1 T ER0 D EY2 Z',
+    'saturdays': 'S AE1 T ER0 D EY2 Z',
+}
+
+# Mensajes de estado (descarga/carga). El CLI los muestra en stderr con --verbose.
+logger = logging.getLogger(__name__)
+
+# Subir cuando cambie el formato o la lógica de parseo — invalida los .pkl previos
+PARSED_CACHE_VERSION = 3
+
 
 class CMUDictionary:
     """
@@ -26,40 +58,148 @@ class CMUDictionary:
     """
 
     def __init__(self):
+        # palabra → ARPABET crudo de la variante elegida; el IPA se genera al consultar
         self._dict: Dict[str, str] = {}
+        self._trie: Optional[PhonemeTrie] = None
         self._loaded = False
+        # Serializa la primera carga: dos hilos no deben parsear el archivo a la vez
+        self._load_lock = threading.Lock()
 
     def load(self, force_download: bool = False) -> None:
-        """Carga el diccionario desde caché local o descarga si no existe."""
+        """
+        Carga el diccionario desde caché local o descarga si no existe.
+
+        Tras force_download=True, llamar jelou.clear_cache(): la caché por
+        palabra de translate_word conserva resultados del diccionario anterior.
+        """
         if self._loaded and not force_download:
             return
-        if CACHE_FILE.exists() and not force_download:
-            self._load_from_file(CACHE_FILE)
-        else:
-            self._download_and_cache()
-            self._load_from_file(CACHE_FILE)
-        self._loaded = True
+        with self._load_lock:
+            # Otro hilo pudo completar la carga mientras se esperaba el lock
+            if self._loaded and not force_download:
+                return
+            if CACHE_FILE.exists() and not force_download:
+                self._load_parsed(CACHE_FILE)
+            else:
+                self._download_and_cache()
+                self._load_parsed(CACHE_FILE)
+            self._trie = None
+            self._loaded = True
 
     def _download_and_cache(self) -> None:
-        """Descarga el diccionario desde GitHub y lo guarda en ~/.jelou/"""
-        print("📥 Descargando CMU Pronouncing Dictionary...")
+        """
+        Descarga el diccionario desde GitHub y lo guarda en ~/.jelou/
+
+        Si ya hay una copia, la petición es condicional (ETag / Last-Modified
+        guardados en cmudict.meta.json): un 304 deja el archivo intacto sin
+        bajar el cuerpo.
+        """
+        # urllib.request es caro de importar y solo hace falta la primera vez
+        import urllib.error
+        import urllib.request
+
+        logger.info("📥 Descargando CMU Pronouncing Dictionary...")
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        meta_file = CACHE_FILE.with_suffix(".meta.json")
+        request = urllib.request.Request(CMU_DICT_URL)
+        if CACHE_FILE.exists() and meta_file.exists():
+            try:
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("etag"):
+                request.add_header("If-None-Match", meta["etag"])
+            if meta.get("last_modified"):
+                request.add_header("If-Modified-Since", meta["last_modified"])
+
+        # Bytes directo a disco, sin decodificar; el .tmp evita dejar un caché a medias
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
         try:
-            with urllib.request.urlopen(CMU_DICT_URL) as response:
-                content = response.read().decode("utf-8")
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                f.write(content)
-            print(f"✅ Diccionario descargado y guardado en: {CACHE_FILE}")
+            with urllib.request.urlopen(request) as response:
+                with open(tmp_file, "wb") as f:
+                    shutil.copyfileobj(response, f, length=1 << 20)
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            os.replace(tmp_file, CACHE_FILE)
+        except urllib.error.HTTPError as e:
+            tmp_file.unlink(missing_ok=True)
+            if e.code != 304:
+                raise RuntimeError(f"Error descargando el diccionario CMU: {e}")
+            # Sin cambios: no se toca el archivo, así el .pkl sigue siendo válido
+            logger.info("✅ Diccionario sin cambios: %s", CACHE_FILE)
+            return
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             raise RuntimeError(f"Error descargando el diccionario CMU: {e}")
 
+        logger.info("✅ Diccionario descargado y guardado en: %s", CACHE_FILE)
+        # Sin metadatos la próxima descarga solo pierde la petición condicional
+        try:
+            meta_file.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError as e:
+            logger.warning("No se pudieron guardar los metadatos de descarga: %s", e)
+
+    @staticmethod
+    def _parsed_cache_path(filepath: Path) -> Path:
+        """
+        Ruta del .pkl ligada a la versión del parser y al tamaño/mtime del
+        diccionario — un stat en lugar de leer y hashear los ~4 MB en cada arranque.
+        """
+        stat = filepath.stat()
+        key = f"{PARSED_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return filepath.parent / f"cmudict-{digest}.pkl"
+
+    def _load_parsed(self, filepath: Path) -> None:
+        """
+        Carga el dict ya parseado desde el .pkl si existe; si no, parsea el
+        diccionario y guarda el resultado para los siguientes arranques.
+        """
+        parsed_path = self._parsed_cache_path(filepath)
+        if parsed_path.exists():
+            # Un .pkl truncado o ajeno puede fallar con casi cualquier excepción
+            # (AttributeError, ValueError, ImportError...): nunca debe impedir
+            # el arranque, se regenera abajo
+            try:
+                with open(parsed_path, "rb") as f:
+                    parsed = pickle.load(f)
+                if isinstance(parsed, dict):
+                    self._dict = parsed
+                    return
+            except Exception:
+                pass
+
+        self._load_from_file(filepath)
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=parsed_path.parent, delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                pickle.dump(self._dict, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, parsed_path)
+            tmp_name = None
+            # Los .pkl de versiones o descargas anteriores ya no se van a leer
+            for stale in parsed_path.parent.glob("cmudict-*.pkl"):
+                if stale != parsed_path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            # Sin permisos o disco lleno — el próximo arranque parsea de nuevo
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
     def _score_variant(self, arpabet: str) -> tuple:
         """
         Puntaje para elegir la mejor variante CMU. Menor = mejor.
         Criterios: HH > AH0 > UW0 (menos es mejor en cada uno).
+
+        Cuenta subcadenas sobre el ARPABET crudo (el CMU ya viene en mayúsculas):
+        ningún otro fonema contiene HH, AH0 ni UW0, así que equivale a contar
+        tokens sin crear la lista de split().
         """
-        tokens = arpabet.upper().split()
-        return (tokens.count("HH"), tokens.count("AH0"), tokens.count("UW0"))
+        return (arpabet.count("HH"), arpabet.count("AH0"), arpabet.count("UW0"))
 
     def _load_from_file(self, filepath: Path) -> None:
         """
@@ -68,97 +208,121 @@ class CMUDictionary:
         - _PREFER_EY: días de la semana usan variante con EY → dei
         - _score_variant: para el resto, menor score = mejor variante
         """
-        print(f"📖 Cargando diccionario desde: {filepath}")
-
-        # Días de la semana: forzar variante EY para que terminen en "dei"
-        _PREFER_EY = {
-            'monday', 'tuesday', 'wednesday', 'thursday',
-            'friday', 'saturday', 'sunday',
-            "monday's", "tuesday's", "wednesday's", "thursday's",
-            "friday's", "saturday's", "sunday's",
-            'mondays', 'tuesdays', 'wednesdays', 'thursdays',
-            'fridays', 'saturdays', 'sundays'
-        }
-
-        # El CMU no tiene variante con ER+EY para saturday — se define manualmente
-        _MANUAL_OVERRIDES = {
-            'saturday': 'S AE1 T ER0 D EY2',
-            "saturday's": 'S AE1 T ER0 D EY2 Z',
-            'saturdays': 'S AE1 T ER0 D EY2 Z',
-        }
-
-        _arpabet_cache: Dict[str, str] = {}
-
-        for word, arpabet in _MANUAL_OVERRIDES.items():
-            self._dict[word] = arpabet_to_ipa(arpabet)
-            _arpabet_cache[word] = arpabet
-
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith(";;;"):
-                    continue
-                parts = line.split(maxsplit=1)
-                if len(parts) < 2:
-                    continue
-                word_raw, arpabet = parts
-                word = word_raw.split("(")[0].lower()
-                is_variant = "(" in word_raw
-
-                if word in _MANUAL_OVERRIDES:
-                    continue
-
-                if not is_variant:
-                    self._dict[word] = arpabet_to_ipa(arpabet)
-                    _arpabet_cache[word] = arpabet
-                else:
-                    current_arpabet = _arpabet_cache.get(word, "")
-                    current_score = self._score_variant(current_arpabet)
-                    new_score = self._score_variant(arpabet)
-
-                    if word in _PREFER_EY and "EY" in arpabet.upper():
-                        self._dict[word] = arpabet_to_ipa(arpabet)
-                        _arpabet_cache[word] = arpabet
-                    elif new_score < current_score:
-                        self._dict[word] = arpabet_to_ipa(arpabet)
-                        _arpabet_cache[word] = arpabet
-
-        print(f"✅ Diccionario cargado: {len(self._dict)} palabras")
+        logger.info("📖 Cargando diccionario desde: %s", filepath)
+
+        # Se elige la variante ganadora de cada palabra (ARPABET crudo)
+        best: Dict[str, str] = dict(_MANUAL_OVERRIDES)
+
+        # Una sola lectura + splitlines: evita el costo por línea del iterador
+        # de archivo
+        text = filepath.read_bytes().decode("utf-8")
+        for line in text.splitlines():
+            line = line.strip()
+            # Comparar el primer carácter antes de startswith: casi ninguna
+            # línea es comentario
+            if not line or (line[0] == ";" and line.startswith(";;;")):
+                continue
+            parts = line.split(maxsplit=1)
+            if len(parts) < 2:
+                continue
+            word_raw, arpabet = parts
+            # partition no arma la lista que crea split("(")
+            word_base, paren, _ = word_raw.partition("(")
+            word = sys.intern(word_base.lower())
+            is_variant = bool(paren)
+
+            if word in _MANUAL_OVERRIDES:
+                continue
+
+            if not is_variant:
+                best[word] = arpabet
+            elif word in _PREFER_EY and "EY" in arpabet:
+                best[word] = arpabet
+            elif self._score_variant(arpabet) < self._score_variant(best.get(word, "")):
+                best[word] = arpabet
+
+        # La conversión a IPA se difiere hasta lookup() — una sesión consulta
+        # decenas de palabras, no las 126k
+        self._dict = best
+
+        logger.info("✅ Diccionario cargado: %d palabras", len(self._dict))
 
     def lookup_with_stress(self, word: str) -> Optional[str]:
-        """Retorna IPA con marcadores ~~STRESS~~. Para uso interno del motor."""
+        """Retorna IPA con STRESS_MARKER. Para uso interno del motor."""
         self.load()
-        return self._dict.get(word.lower())
+        arpabet = self._dict.get(word.lower())
+        return arpabet_to_ipa(arpabet) if arpabet else None
 
     def lookup(self, word: str) -> Optional[str]:
         """Retorna IPA limpio sin marcadores de stress, o None si no existe."""
         if not self._loaded:
             self.load()
-        result = self._dict.get(word.lower())
-        if result:
-            return result.replace("~~STRESS~~", "")
-        return None
+        arpabet = self._dict.get(word.lower())
+        return arpabet_to_ipa_clean(arpabet) if arpabet else None
+
+    def lookup_both(self, word: str) -> Tuple[Optional[str], Optional[str]]:
+        """Retorna (IPA limpio, IPA con STRESS_MARKER) con una sola búsqueda."""
+        if not self._loaded:
+            self.load()
+        arpabet = self._dict.get(word.lower())
+        if not arpabet:
+            return None, None
+        return arpabet_to_ipa_clean(arpabet), arpabet_to_ipa(arpabet)
+
+    def lookup_prefix(self, prefix: str) -> List[Tuple[str, str]]:
+        """
+        Retorna (palabra, ipa limpio) de las palabras que empiezan por prefix.
+        El trie se construye en la primera búsqueda por prefijo.
+        """
+        self.load()
+        trie = self._trie
+        if trie is None:
+            with self._load_lock:
+                # Otro hilo pudo construirlo mientras se esperaba el lock
+                trie = self._trie
+                if trie is None:
+                    # _convert directo: pasar las ~126k entradas por
+                    # arpabet_to_ipa_clean vaciaría su lru_cache de búsquedas
+                    trie = PhonemeTrie()
+                    for word, arpabet in self._dict.items():
+                        trie.insert(word, _convert(arpabet, emit_stress=False))
+                    self._trie = trie
+        return list(trie.items(prefix.lower()))
 
     def __len__(self) -> int:
         return len(self._dict)
 
 
-_cmu_dict = CMUDictionary()
+# Se construye en el primer uso — el modo IPA nunca llega a instanciarlo
+_cmu_dict: Optional[CMUDictionary] = None
+_cmu_dict_lock = threading.Lock()
 
 
 def get_dictionary() -> CMUDictionary:
-    """Retorna la instancia singleton del diccionario."""
+    """Retorna la instancia singleton del diccionario, creándola si hace falta."""
+    global _cmu_dict
+    if _cmu_dict is None:
+        with _cmu_dict_lock:
+            if _cmu_dict is None:
+                _cmu_dict = CMUDictionary()
     return _cmu_dict
 
 
 def lookup_word(word: str) -> Optional[str]:
     """Busca una palabra y retorna su IPA limpio o None."""
-    return _cmu_dict.lookup(word)
+    return get_dictionary().lookup(word)
+
+
+def lookup_prefix(prefix: str) -> List[Tuple[str, str]]:
+    """Busca todas las palabras que empiezan por prefix, en orden alfabético."""
+    return get_dictionary().lookup_prefix(prefix)
+
+
+def lookup_word_both(word: str) -> Tuple[Optional[str], Optional[str]]:
+    """Busca una palabra y retorna (IPA limpio, IPA con stress) o (None, None)."""
+    return get_dictionary().lookup_both(word)
 
 
 def lookup_word_with_stress(word: str) -> Optional[str]:
     """Busca una palabra y retorna su IPA con marcadores de stress."""
-    global _cmu_dict
-    if _cmu_dict is None:
-        _cmu_dict = get_dictionary()
-    return _cmu_dict.lookup_with_stress(word)
\ No newline at end of file
+    return get_dictionary().lookup_with_stress(word)
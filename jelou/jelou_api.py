@@ -9,10 +9,41 @@ Proyecto: Jelou
 Licencia: MIT
 """
 
-from typing import List, Dict
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from jelou.cmu_dictionary import lookup_word, lookup_word_with_stress
-from jelou.phonetic_engine import ipa_to_spanish
+from jelou.arpabet_to_ipa import STRESS_MARKER
+from jelou.phonetic_engine import STRESS_MAP, ipa_to_spanish
+
+# ˈ estándar que precede a una vocal tónica conocida. Un ˈ antes de consonante
+# (edʒˈkeɪʃən, mɪsˈhæp) no marca vocal: lo descarta ipa_to_spanish junto con ˌ
+_STRESS_BEFORE_VOWEL = re.compile(
+    "ˈ(?=" + "|".join(re.escape(k) for k in STRESS_MAP) + ")"
+)
+
+
+@lru_cache(maxsize=100_000)
+def _translate_cached(word_lc: str) -> Tuple[Optional[str], Optional[str]]:
+    """Búsqueda + conversión de una palabra ya en minúsculas → (ipa, español)."""
+    # Import diferido: el modo IPA (translate_ipa) no carga el módulo del diccionario
+    from jelou.cmu_dictionary import lookup_word_both
+
+    ipa_display, ipa = lookup_word_both(word_lc)
+    if not ipa:
+        return None, None
+    return ipa_display, ipa_to_spanish(ipa)
+
+
+def _build_result(word: str, cached: Tuple[Optional[str], Optional[str]]) -> Dict:
+    """Arma el dict público desde (ipa, español) con la palabra original."""
+    ipa_display, spanish = cached
+    return {
+        "word": word,
+        "ipa": ipa_display,
+        "spanish": spanish,
+        "found": spanish is not None,
+    }
 
 
 def translate_word(word: str) -> Dict:
@@ -21,21 +52,22 @@ def translate_word(word: str) -> Dict:
 
     Retorna dict con: word, ipa, spanish, found.
     found=False si la palabra no existe en el CMU Dictionary.
+    Las palabras repetidas salen de caché; el dict se arma nuevo en cada llamada.
 
     >>> translate_word("hello")
     {'word': 'hello', 'ipa': 'hʌloʊ', 'spanish': 'jalóu', 'found': True}
     """
-    result = {"word": word, "ipa": None, "spanish": None, "found": False}
+    return _build_result(word, _translate_cached(word.lower()))
 
-    ipa_display = lookup_word(word)
-    ipa = lookup_word_with_stress(word)
 
-    if ipa:
-        result["ipa"] = ipa_display
-        result["spanish"] = ipa_to_spanish(ipa)
-        result["found"] = True
+def clear_cache() -> None:
+    """
+    Vacía la caché por palabra de translate_word y batch_translate.
 
-    return result
+    Necesario tras recargar el diccionario con load(force_download=True); las
+    cachés de conversión IPA dependen solo de la pronunciación y siguen válidas.
+    """
+    _translate_cached.cache_clear()
 
 
 def translate_ipa(ipa: str) -> str:
@@ -43,7 +75,7 @@ def translate_ipa(ipa: str) -> str:
     Convierte IPA directamente a fonética en español sin usar el diccionario.
 
     Manejo de stress:
-    - Si tiene ˈ estándar → convierte a ~~STRESS~~
+    - Si tiene ˈ estándar antes de vocal → convierte a STRESS_MARKER
     - Si tiene vocal larga (iː/uː) → inserta stress ahí
     - Sin ninguno → procesa sin acento
 
@@ -53,11 +85,11 @@ def translate_ipa(ipa: str) -> str:
     'shí'
     """
     if "ˈ" in ipa:
-        return ipa_to_spanish(ipa.replace("ˈ", "~~STRESS~~"))
+        return ipa_to_spanish(_STRESS_BEFORE_VOWEL.sub(STRESS_MARKER, ipa))
 
     for lv in ["iː", "uː"]:
         if lv in ipa:
-            return ipa_to_spanish(ipa.replace(lv, "~~STRESS~~" + lv, 1))
+            return ipa_to_spanish(ipa.replace(lv, STRESS_MARKER + lv, 1))
 
     return ipa_to_spanish(ipa)
 
@@ -69,4 +101,21 @@ def batch_translate(words: List[str]) -> List[Dict]:
     >>> batch_translate(["hello", "world"])
     [{'word': 'hello', ...}, {'word': 'world', ...}]
     """
-    return [translate_word(word) for word in words]
\ No newline at end of file
+    # Cada palabra distinta se resuelve una vez; las repeticiones reusan el resultado
+    unique = {word.lower(): None for word in words}
+    for word_lc in unique:
+        unique[word_lc] = _translate_cached(word_lc)
+
+    return [_build_result(word, unique[word.lower()]) for word in words]
+
+
+def warmup() -> None:
+    """
+    Carga el diccionario CMU por adelantado.
+
+    Sin esto la carga ocurre en la primera traducción de palabra. Un servidor
+    puede llamarla al arrancar para que esa latencia no la pague el primer request.
+    """
+    from jelou.cmu_dictionary import get_dictionary
+
+    get_dictionary().load()
@@ -8,22 +8,29 @@ Licencia: MIT
 """
 
 import re
+from functools import lru_cache
+from typing import Iterable, List
+from types import MappingProxyType
 
-# θ y ð se protegen con TEMP_Z para que CONSONANT_RULES no los convierta a s
-COMPOUND_RULES = {
+from jelou.arpabet_to_ipa import STRESS_MARKER
+
+# θ y ð → z: la pasada única no vuelve a escanear su salida, así que la regla
+# z → s de CONSONANT_RULES no las alcanza
+_COMPOUND_RULES = {
     "aɪər": "air",
     "aʊər": "aur",
     "dʒ": "dch",
     "tʃ": "ch",
-    "θ": "~~~TEMP_Z~~~",
-    "ð": "~~~TEMP_Z~~~",
+    "θ": "z",
+    "ð": "z",
     "ʃ": "sh",
     "ʒ": "sh",
     "eər": "er",
 }
+COMPOUND_RULES = MappingProxyType(_COMPOUND_RULES)
 
 # iː/uː → i/u por defecto (átonas). El acento se aplica solo via STRESS_MAP.
-VOWEL_RULES = {
+_VOWEL_RULES = {
     "iː": "i",
     "ɪ": "i",
     "ɛ": "e",
@@ -40,13 +47,14 @@ VOWEL_RULES = {
     "ɝ": "er",
     "ɚ": "er",
 }
+VOWEL_RULES = MappingProxyType(_VOWEL_RULES)
 
-CONSONANT_RULES = {
+_CONSONANT_RULES = {
     "h": "j",
     "ŋ": "ng",
     "k": "k",
     "s": "s",
-    "z": "s",  # z nativa inglesa → s (zone→sóun). Solo θ/ð generan z via TEMP_Z.
+    "z": "s",  # z nativa inglesa → s (zone→sóun). Solo θ/ð generan z.
     "w": "w",
     "r": "r",
     "l": "l",
@@ -60,26 +68,88 @@ CONSONANT_RULES = {
     "d": "d",
     "g": "g",
 }
+CONSONANT_RULES = MappingProxyType(_CONSONANT_RULES)
+
+# Vocal tónica (precedida de STRESS_MARKER) → vocal española con tilde
+_STRESS_MAP = {
+    "aʊ": "áu", "aɪ": "ái", "eɪ": "éi", "oʊ": "óu", "ɔɪ": "ói",
+    "iː": "í",  "uː": "ú",
+    "ɑ": "á",   "æ": "á",   "ʌ": "á",   "ɔ": "ó",
+    "ɛ": "é",   "ɝ": "ér",  "ɪ": "í",   "i": "í",   "ʊ": "ú",
+}
+STRESS_MAP = MappingProxyType(_STRESS_MAP)
+
+# STRESS_MARKER + vocal tónica → vocal con tilde, resuelto dentro de la pasada
+# única de reglas. arpabet_to_ipa y translate_ipa solo ponen el marcador antes de
+# vocal; uno suelto (entrada directa mal formada) se descarta.
+_STRESS_RULES = {STRESS_MARKER + k: v for k, v in _STRESS_MAP.items()}
+# Diptongo tónico + ː (aɪː, oʊː...): la ː se pierde como en iː → i / uː → u
+_STRESS_RULES.update({
+    STRESS_MARKER + k + "ː": v
+    for k, v in _STRESS_MAP.items()
+    if len(k) == 2 and v[-1] in "iu"
+})
+_STRESS_RULES[STRESS_MARKER] = ""
 
 _VOWELS = "aeiouɪʊʌɛæɑɔəɝɚ"
 
+# dʒ seguido de consonante (no vocal ni marcador de acento) → ch (vegetable→véchtabal)
+_DJ_CONSONANT = re.compile("dʒ([^" + _VOWELS + STRESS_MARKER + "])")
+
+# Las tres tablas en una sola pasada: la alternancia prueba primero las claves
+# más largas (aɪər antes que aɪ, dʒ antes que d) y el texto ya reemplazado no se
+# vuelve a escanear, así que una regla no puede pisar la salida de otra.
+# Reglas que la pasada única necesita además de las tablas:
+# - j IPA (yod) → i; sh/ch ya adaptados se consumen enteros para que h → j no los rompa
+# - ʊː/aʊː/oʊː: con los replace en secuencia ʊ → u dejaba "uː", que luego caía en u
+_EXTRA_RULES = {
+    "j": "i", "sh": "sh", "ch": "ch",
+    "ʊː": "u", "aʊː": "au", "oʊː": "ou",
+}
+_MERGED_RULES = {
+    **_CONSONANT_RULES, **_VOWEL_RULES, **_COMPOUND_RULES, **_EXTRA_RULES,
+    **_STRESS_RULES,
+}
+
+# Las identidades de un carácter (k → k, s → s...) no entran en la regex: cada
+# coincidencia cuesta una llamada al callback y no cambiaría nada.
+_RULES_PATTERN = re.compile(
+    "|".join(
+        re.escape(k)
+        for k in sorted(_MERGED_RULES, key=len, reverse=True)
+        if len(k) > 1 or _MERGED_RULES[k] != k
+    )
+)
 
+# IPA ya en ASCII (entrada "simple" de translate_ipa): solo pueden coincidir las
+# claves ASCII, así que la alternancia se reduce a sh|ch|h|z|j.
+_ASCII_RULES_PATTERN = re.compile(
+    "|".join(
+        re.escape(k)
+        for k in sorted(_MERGED_RULES, key=len, reverse=True)
+        if k.isascii() and (len(k) > 1 or _MERGED_RULES[k] != k)
+    )
+)
+
+
+# Vocal + y al final de palabra → sh
+_FINAL_Y_VOWELS = frozenset("aeiouáéíóú")
+
+
+@lru_cache(maxsize=20_000)
 def ipa_to_spanish(ipa: str) -> str:
     """
-    Convierte IPA con marcadores ~~STRESS~~ a fonética en español con acento gráfico.
+    Convierte IPA con STRESS_MARKER a fonética en español con acento gráfico.
+    El marcador de texto ~~STRESS~~ de versiones anteriores sigue aceptándose.
 
     El proceso aplica reglas en orden estricto para evitar colisiones:
-    1. Resuelve ~~STRESS~~ → vocal acentuada y protege el resultado
-    2. Elimina marcas IPA (ˈ ˌ) y semivocal j redundante tras dʒ
-    3. Convierte dʒ+consonante → ch (vegetable→véchtabal)
-    4. Protege j IPA para que no colisione con COMPOUND_RULES
-    5. Aplica COMPOUND_RULES (θ/ð→TEMP_Z, dʒ→y, tʃ→ch, ʃ→sh...)
-    6. Protege sh/ch para que CONSONANT_RULES no los rompa
-    7. Aplica VOWEL_RULES
-    8. Aplica CONSONANT_RULES
-    9. Restaura todos los marcadores temporales
-    10. Correcciones contextuales (vocal+y final → sh, pj → pi)
-    11. Correcciones fonéticas (ngk→nk, ngg→ng, íi→íe, ii→ie)
+    1. Elimina marcas IPA (ˈ ˌ) y semivocal j redundante tras dʒ
+    2. Convierte dʒ+consonante → ch (vegetable→véchtabal)
+    3. Aplica COMPOUND_RULES, VOWEL_RULES, CONSONANT_RULES y STRESS_MAP en una
+       sola pasada (gana la clave más larga; STRESS_MARKER+vocal → vocal con
+       tilde; j IPA → i; sh/ch quedan intactos)
+    4. Correcciones contextuales (vocal+y final → sh, pj → pi)
+    5. Correcciones fonéticas (ngk→nk, ngg→ng, íi→íe, ii→ie)
 
     >>> ipa_to_spanish("θɪŋk")
     'zink'
@@ -87,51 +157,24 @@ def ipa_to_spanish(ipa: str) -> str:
     'jelou'
     """
     stressed_ipa = ipa
+    if "~~STRESS~~" in stressed_ipa:
+        stressed_ipa = stressed_ipa.replace("~~STRESS~~", STRESS_MARKER)
 
-    STRESS_MAP = {
-        "aʊ": "áu", "aɪ": "ái", "eɪ": "éi", "oʊ": "óu", "ɔɪ": "ói",
-        "iː": "í",  "uː": "ú",
-        "ɑ": "á",   "æ": "á",   "ʌ": "á",   "ɔ": "ó",
-        "ɛ": "é",   "ɝ": "ér",  "ɪ": "í",   "i": "í",   "ʊ": "ú",
-    }
-    for ipa_v, esp_v in sorted(STRESS_MAP.items(), key=lambda x: -len(x[0])):
-        stressed_ipa = stressed_ipa.replace("~~STRESS~~" + ipa_v, "~~A~~" + esp_v)
-    stressed_ipa = stressed_ipa.replace("~~STRESS~~", "")
-
-    result = stressed_ipa.lower()
-    result = result.replace("ˈ", "").replace("ˌ", "")
+    # El IPA casi siempre llega en minúsculas y sin ˈ/ˌ: se evitan copias innecesarias
+    result = stressed_ipa if stressed_ipa.islower() else stressed_ipa.lower()
+    if "ˈ" in result or "ˌ" in result:
+        result = result.replace("ˈ", "").replace("ˌ", "")
 
-    result = result.replace("~~a~~í", "~~~TEMP_I_STRESS~~~")
-    result = result.replace("~~a~~ú", "~~~TEMP_U_STRESS~~~")
-    result = result.replace("~~a~~", "~~~TEMP_STRESS~~~")
+    # Cada paso se salta si su patrón no aparece: un `in` no construye nada
+    if "dʒ" in result:
+        result = result.replace("dʒj", "dʒ")
+        result = _DJ_CONSONANT.sub(r"ch\1", result)
 
-    result = result.replace("dʒj", "dʒ")
-    result = re.sub(r'dʒ([^' + _VOWELS + r'~])', r'ch\1', result)
-    result = result.replace("j", "~~~TEMP_J~~~")
+    pattern = _ASCII_RULES_PATTERN if result.isascii() else _RULES_PATTERN
+    result = pattern.sub(lambda m: _MERGED_RULES[m.group()], result)
 
-    for ipa_sound, adapted in COMPOUND_RULES.items():
-        result = result.replace(ipa_sound, adapted)
-
-    result = result.replace("sh", "~~~TEMP_SH~~~")
-    result = result.replace("ch", "~~~TEMP_CH~~~")
-
-    for ipa_sound, adapted in VOWEL_RULES.items():
-        result = result.replace(ipa_sound, adapted)
-
-    for ipa_sound, adapted in CONSONANT_RULES.items():
-        result = result.replace(ipa_sound, adapted)
-
-    result = result.replace("~~~TEMP_I_STRESS~~~", "í")
-    result = result.replace("~~~TEMP_U_STRESS~~~", "ú")
-    result = result.replace("~~~TEMP_STRESS~~~", "")
-    result = result.replace("~~~TEMP_J~~~", "i")
-    result = result.replace("~~~TEMP_SH~~~", "sh")
-    result = result.replace("~~~TEMP_CH~~~", "ch")
-    result = result.replace("~~~TEMP_Z~~~", "z")
-
-    for vocal in ["a", "e", "i", "o", "u", "á", "é", "í", "ó", "ú"]:
-        if result.endswith(f"{vocal}y"):
-            result = result[:-1] + "sh"
+    if result.endswith("y") and result[-2:-1] in _FINAL_Y_VOWELS:
+        result = result[:-1] + "sh"
 
     result = result.replace("pj", "pi")
     result = result.replace("ngkz", "ngz")
@@ -141,4 +184,16 @@ def ipa_to_spanish(ipa: str) -> str:
     result = result.replace("ii", "ie")
     result = result.replace("zs", "s")
 
-    return result
\ No newline at end of file
+    return result
+
+
+def ipa_to_spanish_many(ipas: Iterable[str]) -> List[str]:
+    """
+    Convierte una secuencia de IPA en una sola llamada, conservando el orden.
+    Las entradas repetidas salen de la caché de ipa_to_spanish.
+
+    >>> ipa_to_spanish_many(["θɪŋk", "hɛloʊ"])
+    ['zink', 'jelou']
+    """
+    convert = ipa_to_spanish
+    return [convert(ipa) for ipa in ipas]
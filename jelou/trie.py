@@ -0,0 +1,85 @@
+"""
+Trie de palabras para búsquedas por prefijo sobre el CMU Dictionary.
+Comparte los prefijos comunes entre palabras — "hello", "help", "helmet"
+cuelgan del mismo camino h → e → l.
+
+Autor: Nicolás Espejo
+Proyecto: Jelou
+Licencia: MIT
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class _Node:
+    """Nodo del trie: hijos por carácter y valor opcional si termina una palabra."""
+
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.value: Optional[str] = None
+
+
+class PhonemeTrie:
+    """
+    Trie palabra → IPA con la misma semántica de get() que un dict.
+
+    >>> trie = PhonemeTrie()
+    >>> trie.insert("hello", "hʌloʊ")
+    >>> trie.get("hello")
+    'hʌloʊ'
+    >>> list(trie.items("hel"))
+    [('hello', 'hʌloʊ')]
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def insert(self, word: str, ipa: str) -> None:
+        """Inserta o reemplaza la pronunciación de una palabra."""
+        node = self._root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+        if node.value is None:
+            self._size += 1
+        node.value = ipa
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, word: str, default: Optional[str] = None) -> Optional[str]:
+        """Retorna el IPA de la palabra exacta, o default si no existe."""
+        node = self._find(word)
+        if node is None or node.value is None:
+            return default
+        return node.value
+
+    def items(self, prefix: str = "") -> Iterator[Tuple[str, str]]:
+        """Itera (palabra, ipa) de todas las palabras que empiezan por prefix."""
+        node = self._find(prefix)
+        if node is None:
+            return
+        stack = [(prefix, node)]
+        while stack:
+            word, node = stack.pop()
+            if node.value is not None:
+                yield word, node.value
+            # Orden inverso para que la pila entregue las palabras en orden alfabético
+            for char in sorted(node.children, reverse=True):
+                stack.append((word + char, node.children[char]))
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def __len__(self) -> int:
+        return self._size
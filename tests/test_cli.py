@@ -0,0 +1,45 @@
+"""
+Tests para el CLI de Jelou
+"""
+
+import sys
+
+from jelou import cli
+
+
+def test_static_help_matches_argparse(monkeypatch):
+    """La ayuda estática debe coincidir con la que genera argparse"""
+    monkeypatch.setenv("COLUMNS", "80")
+    generated = cli._build_parser().format_help()
+    # Python < 3.10 titula la sección como "optional arguments:"
+    generated = generated.replace("optional arguments:", "options:")
+    assert generated == cli._STATIC_HELP
+
+
+def test_help_fast_path(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["jelou"])
+    cli.main()
+    assert capsys.readouterr().out == cli._STATIC_HELP
+
+
+def test_version(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["jelou", "--version"])
+    cli.main()
+    assert capsys.readouterr().out.strip() == f"jelou {cli.__version__}"
+
+
+def test_ipa_mode(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["jelou", "--ipa", "/θɪŋk/"])
+    cli.main()
+    assert capsys.readouterr().out.strip() == "zink"
+
+
+def test_single_word_skips_argparse(monkeypatch, capsys):
+    """`jelou <palabra>` no construye el parser"""
+    def fail():
+        raise AssertionError("argparse no debería construirse")
+
+    monkeypatch.setattr(cli, "_build_parser", fail)
+    monkeypatch.setattr(sys, "argv", ["jelou", "hello"])
+    cli.main()
+    assert capsys.readouterr().out.strip() == "jelóu"
@@ -0,0 +1,200 @@
+"""
+Tests para el cargador del CMU Dictionary
+"""
+
+from jelou.arpabet_to_ipa import STRESS_MARKER
+from jelou.cmu_dictionary import CMUDictionary
+
+SAMPLE = """;;; comentario
+hello HH AH0 L OW1
+hello(2) HH EH0 L OW1
+world W ER1 L D
+"""
+
+
+def test_parsed_cache_roundtrip(tmp_path):
+    """El segundo arranque lee el .pkl y obtiene el mismo diccionario"""
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+
+    first = CMUDictionary()
+    first._load_parsed(source)
+    assert len(list(tmp_path.glob("cmudict-*.pkl"))) == 1
+
+    second = CMUDictionary()
+    second._load_parsed(source)
+    assert second._dict == first._dict
+    second._loaded = True
+    assert second.lookup_with_stress("world") == "w" + STRESS_MARKER + "ɝld"
+    assert second.lookup("hello") == "hɛloʊ"  # variante sin AH0
+
+
+def test_download_streams_to_cache(tmp_path, monkeypatch):
+    """La descarga escribe los bytes tal cual y no deja el .tmp"""
+    from jelou import cmu_dictionary
+
+    remote = tmp_path / "remote.dict"
+    remote.write_text(SAMPLE, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cmu_dictionary, "CMU_DICT_URL", remote.as_uri())
+    monkeypatch.setattr(cmu_dictionary, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(cmu_dictionary, "CACHE_FILE", cache_dir / "cmudict.txt")
+
+    CMUDictionary()._download_and_cache()
+    assert (cache_dir / "cmudict.txt").read_bytes() == remote.read_bytes()
+    assert not (cache_dir / "cmudict.tmp").exists()
+
+
+def test_download_survives_metadata_write_failure(tmp_path, monkeypatch):
+    """Si no se pueden guardar los metadatos, la descarga igual queda en caché"""
+    from jelou import cmu_dictionary
+
+    remote = tmp_path / "remote.dict"
+    remote.write_text(SAMPLE, encoding="utf-8")
+    monkeypatch.setattr(cmu_dictionary, "CMU_DICT_URL", remote.as_uri())
+    monkeypatch.setattr(cmu_dictionary, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cmu_dictionary, "CACHE_FILE", tmp_path / "cmudict.txt")
+    # Un directorio en la ruta de los metadatos hace fallar write_text
+    (tmp_path / "cmudict.meta.json").mkdir()
+
+    CMUDictionary()._download_and_cache()
+    assert (tmp_path / "cmudict.txt").read_bytes() == remote.read_bytes()
+
+
+def test_parsed_cache_invalidated_by_source_change(tmp_path):
+    """Si cambia el diccionario fuente se regenera el .pkl y se borra el anterior"""
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    CMUDictionary()._load_parsed(source)
+
+    source.write_text(SAMPLE + "think TH IH1 NG K\n", encoding="utf-8")
+    updated = CMUDictionary()
+    updated._load_parsed(source)
+    assert "think" in updated._dict
+    assert len(list(tmp_path.glob("cmudict-*.pkl"))) == 1
+
+
+def test_foreign_parsed_cache_falls_back_to_parse(tmp_path):
+    """Un .pkl que no se puede deserializar se ignora y se regenera"""
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    d = CMUDictionary()
+    # Referencia a un atributo inexistente: pickle.load lanza AttributeError
+    d._parsed_cache_path(source).write_bytes(b"cjelou\nNoSuchThing\n.")
+
+    d._load_parsed(source)
+    assert "world" in d._dict
+
+
+def test_failed_parsed_cache_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    """Si falla el guardado del .pkl no quedan temporales en el directorio"""
+    from jelou import cmu_dictionary
+
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+
+    def failing_replace(src, dst):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(cmu_dictionary.os, "replace", failing_replace)
+    d = CMUDictionary()
+    d._load_parsed(source)
+    assert "world" in d._dict
+    assert [p.name for p in tmp_path.iterdir()] == ["cmudict.txt"]
+
+
+def test_download_not_modified_keeps_cache(tmp_path, monkeypatch):
+    """Con ETag guardado se envía If-None-Match y un 304 no toca el archivo"""
+    import json
+    import urllib.error
+    import urllib.request
+
+    from jelou import cmu_dictionary
+
+    cache_file = tmp_path / "cmudict.txt"
+    cache_file.write_text(SAMPLE, encoding="utf-8")
+    (tmp_path / "cmudict.meta.json").write_text(json.dumps({"etag": '"abc"'}))
+    monkeypatch.setattr(cmu_dictionary, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cmu_dictionary, "CACHE_FILE", cache_file)
+
+    sent = {}
+
+    def fake_urlopen(request):
+        sent.update(request.header_items())
+        raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    CMUDictionary()._download_and_cache()
+    assert sent["If-none-match"] == '"abc"'
+    assert cache_file.read_text(encoding="utf-8") == SAMPLE
+
+
+def test_concurrent_first_load_parses_once(tmp_path, monkeypatch):
+    """Varios hilos en la primera consulta disparan una sola carga"""
+    import threading
+
+    from jelou import cmu_dictionary
+
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    monkeypatch.setattr(cmu_dictionary, "CACHE_FILE", source)
+
+    d = CMUDictionary()
+    calls = []
+    original = d._load_parsed
+    monkeypatch.setattr(
+        d, "_load_parsed", lambda path: (calls.append(path), original(path))
+    )
+
+    threads = [threading.Thread(target=d.lookup, args=("hello",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert d.lookup("world") == "wɝld"
+
+
+def test_lookup_both_matches_single_lookups(tmp_path):
+    """lookup_both devuelve lo mismo que lookup + lookup_with_stress"""
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+
+    d = CMUDictionary()
+    d._load_parsed(source)
+    d._loaded = True
+    assert d.lookup_both("World") == (d.lookup("world"), d.lookup_with_stress("world"))
+    assert d.lookup_both("missing") == (None, None)
+
+
+def test_prefix_trie_built_once_without_touching_cache(tmp_path, monkeypatch):
+    """Hilos concurrentes construyen un solo trie y no llenan la lru_cache"""
+    import threading
+
+    from jelou import cmu_dictionary
+    from jelou.arpabet_to_ipa import arpabet_to_ipa_clean
+
+    source = tmp_path / "cmudict.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    d = CMUDictionary()
+    d._load_parsed(source)
+    d._loaded = True
+
+    built = []
+
+    class CountingTrie(cmu_dictionary.PhonemeTrie):
+        def __init__(self):
+            built.append(self)
+            super().__init__()
+
+    monkeypatch.setattr(cmu_dictionary, "PhonemeTrie", CountingTrie)
+    arpabet_to_ipa_clean.cache_clear()
+
+    threads = [threading.Thread(target=d.lookup_prefix, args=("h",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(built) == 1
+    assert d.lookup_prefix("Wor") == [("world", "wɝld")]
+    assert arpabet_to_ipa_clean.cache_info().currsize == 0
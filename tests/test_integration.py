@@ -1,7 +1,9 @@
 """
 Tests de integración end-to-end para Jelou API
 """
-from jelou.jelou_api import translate_word, translate_ipa
+import pytest
+
+from jelou.jelou_api import clear_cache, translate_word, translate_ipa
 
 def test_translate_ipa_direct():
     assert translate_ipa("θɪŋk") == "zink"
@@ -33,47 +35,63 @@ def test_integration_vision():
     result = translate_ipa("vɪʒʌn")
     assert result == "vishan"
 
-def test_integration_vehicle():
-    result = translate_word("vehicle")
-    assert result['found'] is True
-    assert result['spanish'] == "víekal"
 
-def test_integration_impossible():
-    result = translate_word("impossible")
+@pytest.mark.parametrize("word,expected", [
+    ("vehicle", "víekal"),
+    ("impossible", "impásabal"),
+    ("communication", "kamiunakéishan"),
+    ("education", "edchukéishan"),
+    ("information", "inferméishan"),
+    ("vegetable", "véchtabal"),
+    ("monday", "mándei"),
+    ("saturday", "sáterdei"),
+    ("thursday", "zérsdei"),
+])
+def test_translate_word_expected(word, expected):
+    result = translate_word(word)
     assert result['found'] is True
-    assert result['spanish'] == "impásabal"
+    assert result['spanish'] == expected
 
-def test_integration_communication():
-    result = translate_word("communication")
-    assert result['found'] is True
-    assert result['spanish'] == "kamiunakéishan"
 
-def test_integration_education():
-    result = translate_word("education")
-    assert result['found'] is True
-    assert result['spanish'] == "edchukéishan"
+def test_translate_word_cached_keeps_casing():
+    clear_cache()
+    first = translate_word("hello")
+    first['spanish'] = "mutado"
+    second = translate_word("Hello")
+    assert second['word'] == "Hello"
+    assert second['spanish'] == translate_word("hello")['spanish'] != "mutado"
 
-def test_integration_information():
-    result = translate_word("information")
-    assert result['found'] is True
-    assert result['spanish'] == "inferméishan"
 
-def test_integration_vegetable():
-    result = translate_word("vegetable")
-    assert result['found'] is True
-    assert result['spanish'] == "véchtabal"
+def test_batch_translate_repeated_words():
+    from jelou.jelou_api import batch_translate
+    results = batch_translate(["Hello", "hello", "xyzabc123notaword", "Hello"])
+    words = [r['word'] for r in results]
+    assert words == ["Hello", "hello", "xyzabc123notaword", "Hello"]
+    assert results[0]['spanish'] == results[1]['spanish'] == results[3]['spanish']
+    assert results[0] is not results[3]
+    assert results[2]['found'] is False
 
-def test_integration_monday():
-    result = translate_word("monday")
-    assert result['found'] is True
-    assert result['spanish'] == "mándei"
 
-def test_integration_saturday():
-    result = translate_word("saturday")
-    assert result['found'] is True
-    assert result['spanish'] == "sáterdei"
+def test_translate_ipa_stress_before_consonant():
+    # ˈ antes de consonante no debe frenar dʒ+consonante → ch ni separar s+h
+    assert translate_ipa("ˌɛdʒˈkeɪʃən") == "echkeishan"
+    assert translate_ipa("ˌmɪsˈhæp") == "mishap"
+    assert translate_ipa("æsˈhɔːl") == "ashoːl"
 
-def test_integration_thursday():
-    result = translate_word("thursday")
-    assert result['found'] is True
-    assert result['spanish'] == "zérsdei"
\ No newline at end of file
+
+def test_clear_cache_after_forced_reload(monkeypatch):
+    from jelou.cmu_dictionary import get_dictionary
+    d = get_dictionary()
+    before = translate_word("hello")['spanish']
+    # Simula una descarga que cambia la pronunciación de "hello"
+    fake = {"hello": "W ER1 L D", "world": "W ER1 L D"}
+    monkeypatch.setattr(d, "_dict", d._dict)
+    monkeypatch.setattr(d, "_download_and_cache", lambda: None)
+    monkeypatch.setattr(d, "_load_parsed", lambda path: setattr(d, "_dict", fake))
+    try:
+        d.load(force_download=True)
+        clear_cache()
+        assert translate_word("hello")['spanish'] == translate_word("world")['spanish']
+        assert translate_word("hello")['spanish'] != before
+    finally:
+        clear_cache()
@@ -1,4 +1,4 @@
-from jelou.phonetic_engine import ipa_to_spanish
+from jelou.phonetic_engine import ipa_to_spanish, ipa_to_spanish_many
 
 def test_basic_words():
     assert ipa_to_spanish("θɪŋk") == "zink"
@@ -50,3 +50,17 @@ def test_diphthong_r():
     assert ipa_to_spanish("faɪər") == "fair"
     assert ipa_to_spanish("aʊər") == "aur"
     assert ipa_to_spanish("haʊər") == "jaur"
+
+def test_ascii_ipa():
+    assert ipa_to_spanish("helou") == "jelou"
+    assert ipa_to_spanish("jes") == "ies"
+
+def test_long_u_after_u_glyph():
+    assert ipa_to_spanish("ʊː") == "u"
+    assert ipa_to_spanish("goʊːl") == "goul"
+    assert ipa_to_spanish("aʊːt") == "aut"
+
+def test_ipa_to_spanish_many():
+    ipas = ["θɪŋk", "hɛloʊ", "θɪŋk"]
+    assert ipa_to_spanish_many(ipas) == [ipa_to_spanish(ipa) for ipa in ipas]
+    assert ipa_to_spanish_many(iter([])) == []
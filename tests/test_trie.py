@@ -0,0 +1,33 @@
+"""
+Tests para el trie de búsqueda por prefijo
+"""
+
+from jelou.trie import PhonemeTrie
+
+
+def test_get_matches_dict_semantics():
+    trie = PhonemeTrie()
+    trie.insert("hello", "hʌloʊ")
+    assert trie.get("hello") == "hʌloʊ"
+    assert trie.get("hell") is None
+    assert trie.get("xyz", "") == ""
+    assert "hello" in trie
+    assert "hel" not in trie
+
+
+def test_insert_replaces_value():
+    trie = PhonemeTrie()
+    trie.insert("read", "rid")
+    trie.insert("read", "rɛd")
+    assert trie.get("read") == "rɛd"
+    assert len(trie) == 1
+
+
+def test_items_with_prefix_sorted():
+    trie = PhonemeTrie()
+    words = [("help", "hɛlp"), ("hello", "hʌloʊ"), ("hat", "hæt"), ("hel", "hɛl")]
+    for word, ipa in words:
+        trie.insert(word, ipa)
+    assert [w for w, _ in trie.items("hel")] == ["hel", "hello", "help"]
+    assert [w for w, _ in trie.items()] == ["hat", "hel", "hello", "help"]
+    assert list(trie.items("zz")) == []
@@ -1,9 +1,5 @@
 from jelou.phonetic_engine import ipa_to_spanish
 
-def test_long_vowels():
-    assert ipa_to_spanish("iː") == "í"
-    assert ipa_to_spanish("uː") == "ú"
-
 def test_short_vowels():
     assert ipa_to_spanish("ɪ") == "i"
     assert ipa_to_spanish("ʌ") == "a"
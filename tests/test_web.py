@@ -7,9 +7,9 @@ import pytest
 from web.app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Cliente de prueba para la aplicación Flask."""
+    """Cliente de prueba para la aplicación Flask, compartido por el módulo."""
     app.config["TESTING"] = True
     with app.test_client() as client:
         yield client
@@ -90,3 +90,86 @@ def test_translate_word_not_found(client):
     data = response.get_json()
     assert data["success"] is True
     assert data["found"] is False
+
+
+def test_translate_word_invalid_chars(client):
+    """Dígitos o símbolos retornan found=False; los apóstrofos sí se buscan."""
+    response = client.post("/api/translate", json={"word": "hello123", "mode": "word"})
+    data = response.get_json()
+    assert data["found"] is False
+    assert data["word"] == "hello123"
+    assert data["ipa"] is None
+
+    response = client.post("/api/translate", json={"word": "Don't", "mode": "word"})
+    assert response.get_json()["found"] is True
+
+
+def test_translate_invalid_body(client):
+    """Cuerpo no JSON retorna 400 y cuerpo enorme retorna 413, nunca 500."""
+    response = client.post(
+        "/api/translate", data="word=hello", content_type="text/plain"
+    )
+    assert response.status_code == 400
+    assert response.get_json()["success"] is False
+
+    response = client.post("/api/translate", json={"word": "a" * 5000})
+    assert response.status_code == 413
+
+
+def test_translate_non_string_word(client):
+    """word que no es texto retorna 400 en vez de un error interno."""
+    response = client.post("/api/translate", json={"word": 123})
+    assert response.status_code == 400
+    assert response.get_json()["success"] is False
+
+
+def test_translate_batch(client):
+    """POST /api/translate_batch traduce cada palabra conservando el orden."""
+    response = client.post(
+        "/api/translate_batch",
+        json={"words": ["Hello", "think", "hello123", "Hello"]}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["success"] is True
+    words = [r["word"] for r in data["results"]]
+    assert words == ["Hello", "think", "hello123", "Hello"]
+    assert data["results"][0]["spanish"] == "jelóu"
+    assert data["results"][2]["found"] is False
+    assert data["results"][3] == data["results"][0]
+
+
+def test_translate_batch_invalid(client):
+    """Lista vacía, demasiado larga o con valores no texto retorna 400."""
+    for payload in ({}, {"words": []}, {"words": ["a"] * 201}, {"words": ["hello", 1]}):
+        response = client.post("/api/translate_batch", json=payload)
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+
+def test_app_starts_without_dictionary():
+    """Si el diccionario no se puede cargar al importar, la app igual arranca."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    # Proceso aparte: recargar web.app aquí reemplazaría la app y el limiter
+    # que comparten los demás tests
+    script = (
+        "import jelou\n"
+        "def failing_warmup():\n"
+        "    raise RuntimeError('sin red')\n"
+        "jelou.warmup = failing_warmup\n"
+        "import web.app\n"
+        "response = web.app.app.test_client().get('/api/health')\n"
+        "assert response.status_code == 200, response.status_code\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "sin red" in result.stderr
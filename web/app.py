@@ -5,6 +5,7 @@ Sirve la interfaz web y expone la API REST.
 Endpoints:
   GET  /              → página principal
   POST /api/translate → traducción palabra o IPA
+  POST /api/translate_batch → traducción de varias palabras en un request
   GET  /api/health    → health check
 
 Autor: Nicolás Espejo
@@ -12,16 +13,63 @@ Proyecto: Jelou
 Licencia: MIT
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+import json
+import logging
+import os
+import re
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from jelou import translate_word, translate_ipa  # noqa: E402
+from jelou import batch_translate, translate_word, translate_ipa, warmup  # noqa: E402
+
+# Cada worker carga el diccionario al arrancar, no en su primer request. Si la
+# descarga falla (sin red), el sitio, /api/health y el modo IPA siguen arriba y
+# la carga se reintenta en la primera traducción de palabra.
+try:
+    warmup()
+except (RuntimeError, OSError) as e:
+    logging.getLogger(__name__).warning(
+        "No se pudo precargar el diccionario CMU: %s", e
+    )
+
+# Separadores de sílaba, marcas de longitud (ː U+02D0 y :) y de acento (ˈ ˌ)
+_IPA_CLEAN = re.compile(r"[.:\u02d0\u02c8\u02cc]")
+
+# Las claves del CMU Dictionary solo usan letras, apóstrofo, punto y guion
+# (máximo 28 caracteres): lo demás es un "no encontrado" seguro sin buscar
+_WORD_RE = re.compile(r"[a-z'.\-]{1,30}", re.IGNORECASE)
+
+
+def _error_body(message: str) -> bytes:
+    """JSON de error serializado una vez, con el mismo formato que jsonify."""
+    body = json.dumps(
+        {"error": message, "success": False}, separators=(",", ":")
+    )
+    return (body + "\n").encode()
+
+
+def _json_error(body: bytes, status: int) -> Response:
+    """Response nueva por request: CORS y el limiter agregan headers a cada una."""
+    return Response(body, status=status, mimetype="application/json")
+
+
+# Mensajes de error fijos de la API
+_ERR_TOO_LARGE = _error_body("La solicitud es demasiado grande")
+_ERR_NO_WORD = _error_body("No se proporcionó ninguna palabra")
+_ERR_EMPTY = _error_body("La palabra está vacía")
+_ERR_TOO_LONG = _error_body("La entrada es demasiado larga (máximo 100 caracteres)")
+_ERR_TOO_MANY = _error_body("Demasiadas palabras (máximo 200)")
+_ERR_BAD_WORDS = _error_body("Cada palabra debe ser texto de máximo 100 caracteres")
+_ERR_INTERNAL = _error_body("Error interno del servidor")
+
+# Payload fijo del health check — Render lo consulta cada pocos segundos
+_HEALTH_BODY = b'{"service":"jelou","status":"ok"}\n'
 
 app = Flask(__name__)
 CORS(app)
@@ -30,7 +78,10 @@ limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    # Con varios workers de Gunicorn, "memory://" lleva un contador por worker;
+    # apuntar RATELIMIT_STORAGE_URI a Redis para compartir el límite entre todos
+    storage_uri=os.environ.get("RATELIMIT_STORAGE_URI", "memory://"),
+    strategy="fixed-window",
 )
 
 
@@ -47,50 +98,91 @@ def translate():
 
     Request:  {"word": "hello", "mode": "word|ipa"}
     Response: {"success": true, "word": ..., "ipa": ..., "spanish": ..., "found": ...}
-    Errors:   400 si falta la palabra, 500 si hay error interno.
+    Errors:   400 si falta la palabra o el cuerpo no es JSON, 413 si el cuerpo
+              es demasiado grande, 500 si hay error interno.
     """
-    try:
-        data = request.get_json()
-
-        if not data or "word" not in data:
-            return jsonify({"success": False, "error": "No se proporcionó ninguna palabra"}), 400
-
-        word = data["word"].strip()
-        mode = data.get("mode", "word")
-
-        if not word:
-            return jsonify({"success": False, "error": "La palabra está vacía"}), 400
-
-        if len(word) > 100:
-            return jsonify({"success": False, "error": "La entrada es demasiado larga (máximo 100 caracteres)"}), 400
-
-        if mode == "ipa":
-    # Limpiar IPA externo — el usuario puede pegar de cualquier diccionario
-            word = word.strip('/')
-            word = word.replace('.', '')
-            word = word.replace('ː', '')   # eliminar marcador de longitud U+02D0
-            word = word.replace(':', '')
-            word = word.replace('ˈ', '')   # eliminar marcador de acento primario
-            word = word.replace('ˌ', '')   # eliminar marcador de acento secundario
-            spanish = translate_ipa(word)
-            return jsonify({
-                "success": True,
-                "word": word,
-                "ipa": word,
-                "spanish": spanish,
-                "found": True,
-                "mode": "ipa",
-    })
-        else:
-            result = translate_word(word)
-            return jsonify({
-                "success": True,
-                **result,
-                "mode": "word",
-            })
-
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    if request.content_length is not None and request.content_length > 4096:
+        return _json_error(_ERR_TOO_LARGE, 413)
+
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get("word"), str):
+        return _json_error(_ERR_NO_WORD, 400)
+
+    word = data["word"].strip()
+    mode = data.get("mode", "word")
+
+    if not word:
+        return _json_error(_ERR_EMPTY, 400)
+
+    if len(word) > 100:
+        return _json_error(_ERR_TOO_LONG, 400)
+
+    if mode == "ipa":
+        # Limpiar IPA externo — el usuario puede pegar de cualquier diccionario
+        word = _IPA_CLEAN.sub("", word.strip('/'))
+        spanish = translate_ipa(word)
+        return jsonify({
+            "success": True,
+            "word": word,
+            "ipa": word,
+            "spanish": spanish,
+            "found": True,
+            "mode": "ipa",
+        })
+    elif not _WORD_RE.fullmatch(word):
+        return jsonify({
+            "success": True,
+            "word": word,
+            "ipa": None,
+            "spanish": None,
+            "found": False,
+            "mode": "word",
+        })
+    else:
+        result = translate_word(word)
+        return jsonify({
+            "success": True,
+            **result,
+            "mode": "word",
+        })
+
+
+@app.route("/api/translate_batch", methods=["POST"])
+@limiter.limit("30 per minute")
+def translate_batch():
+    """
+    Traduce varias palabras en un solo request (p. ej. una oración completa).
+
+    Request:  {"words": ["hello", "world"]}
+    Response: {"success": true, "results": [{"word": ..., "ipa": ...,
+               "spanish": ..., "found": ...}, ...]}
+    Errors:   400 si words no es una lista de 1 a 200 textos de máximo 100
+              caracteres, 413 si el cuerpo es demasiado grande.
+    """
+    if request.content_length is not None and request.content_length > 32768:
+        return _json_error(_ERR_TOO_LARGE, 413)
+
+    data = request.get_json(silent=True)
+    words = data.get("words") if isinstance(data, dict) else None
+
+    if not isinstance(words, list) or not words:
+        return _json_error(_ERR_NO_WORD, 400)
+
+    if len(words) > 200:
+        return _json_error(_ERR_TOO_MANY, 400)
+
+    if not all(isinstance(w, str) and len(w) <= 100 for w in words):
+        return _json_error(_ERR_BAD_WORDS, 400)
+
+    words = [w.strip() for w in words]
+    valid = [bool(_WORD_RE.fullmatch(w)) for w in words]
+    found = iter(batch_translate([w for w, ok in zip(words, valid) if ok]))
+    results = [
+        next(found) if ok else {"word": w, "ipa": None, "spanish": None, "found": False}
+        for w, ok in zip(words, valid)
+    ]
+    return jsonify({"success": True, "results": results})
 
 
 @app.errorhandler(404)
@@ -100,13 +192,16 @@ def not_found(e):
 
 @app.errorhandler(500)
 def server_error(e):
+    # La API responde JSON genérico: el detalle de la excepción queda en los logs
+    if request.path.startswith("/api/"):
+        return _json_error(_ERR_INTERNAL, 500)
     return render_template("500.html"), 500
 
 
 @app.route("/api/health", methods=["GET"])
 def health():
     """Retorna status ok. Usado por Render para monitoreo."""
-    return jsonify({"status": "ok", "service": "jelou"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 if __name__ == "__main__":
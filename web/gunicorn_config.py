@@ -2,5 +2,10 @@
 
 bind = "0.0.0.0:5000"
 workers = 2
-threads = 2
+# gthread: las conexiones keep-alive inactivas esperan en el poller sin ocupar un hilo
+worker_class = "gthread"
+threads = 4
+worker_connections = 1000
+# Reusar la conexión entre requests seguidos (el default de Gunicorn es 2 s)
+keepalive = 30
 timeout = 120